@@ -6,6 +6,10 @@ This is a placeholder — the actual AI/ML model will be plugged in later.
 Currently uses rule-based logic derived from IS456 standards.
 """
 
+from dataclasses import dataclass
+from functools import lru_cache
+
+from models import ElementType
 from schemas import CuringSuggestion
 
 
@@ -16,37 +20,100 @@ GRADE_CURING_DAYS = {
     "M40": 14, "M45": 14, "M50": 28,
 }
 
+# Default curing method by element type (anything unlisted → wet covering)
+ELEMENT_METHOD = {
+    "slab": "ponding",
+    "foundation": "ponding",
+    "beam": "wet_covering",
+    "column": "curing_compound",
+    "wall": "curing_compound",
+    "ceiling": "sprinkler",
+}
+
+# Grades where precast beams/columns are steam cured instead
+HIGH_GRADE_PRECAST = frozenset({"M40", "M45", "M50"})
+STEAM_ELIGIBLE_TYPES = frozenset({"beam", "column"})
+
+_LOW_WC_NOTE = "Low w/c ratio detected — ensure ambient temperature stays above 10°C during curing."
+
+
+@dataclass(frozen=True, slots=True)
+class CuringMethod:
+    name: str
+    cost_per_m3: int
+    notes: str
+    equipment: tuple[str, ...]
+
+
 CURING_METHODS = {
-    "ponding": {
-        "name": "Ponding / Immersion",
-        "cost_per_m3": 150,
-        "notes": "Suitable for slabs and flat surfaces. Water is retained on the surface for the curing period.",
-        "equipment": ["Water pump", "Polythene sheets", "Sand bunds"],
-    },
-    "wet_covering": {
-        "name": "Wet Covering (Hessian/Gunny)",
-        "cost_per_m3": 100,
-        "notes": "Wet jute or hessian cloth is wrapped around the element and kept moist.",
-        "equipment": ["Hessian cloth", "Water tanker", "Sprinkler"],
-    },
-    "curing_compound": {
-        "name": "Curing Compound Application",
-        "cost_per_m3": 200,
-        "notes": "Chemical curing compound sprayed immediately after formwork removal. Good for columns/walls.",
-        "equipment": ["Spray pump", "Curing compound (membrane-forming)"],
-    },
-    "steam_curing": {
-        "name": "Steam Curing",
-        "cost_per_m3": 500,
-        "notes": "Accelerated curing using steam. Used for precast elements needing fast turnaround.",
-        "equipment": ["Steam boiler", "Steam pipes", "Enclosure covers"],
-    },
-    "sprinkler": {
-        "name": "Continuous Sprinkler / Fog Misting",
-        "cost_per_m3": 120,
-        "notes": "Continuous fine water mist sprayed over the element surface.",
-        "equipment": ["Sprinkler system", "Water pump", "Timer control"],
-    },
+    "ponding": CuringMethod(
+        name="Ponding / Immersion",
+        cost_per_m3=150,
+        notes="Suitable for slabs and flat surfaces. Water is retained on the surface for the curing period.",
+        equipment=("Water pump", "Polythene sheets", "Sand bunds"),
+    ),
+    "wet_covering": CuringMethod(
+        name="Wet Covering (Hessian/Gunny)",
+        cost_per_m3=100,
+        notes="Wet jute or hessian cloth is wrapped around the element and kept moist.",
+        equipment=("Hessian cloth", "Water tanker", "Sprinkler"),
+    ),
+    "curing_compound": CuringMethod(
+        name="Curing Compound Application",
+        cost_per_m3=200,
+        notes="Chemical curing compound sprayed immediately after formwork removal. Good for columns/walls.",
+        equipment=("Spray pump", "Curing compound (membrane-forming)"),
+    ),
+    "steam_curing": CuringMethod(
+        name="Steam Curing",
+        cost_per_m3=500,
+        notes="Accelerated curing using steam. Used for precast elements needing fast turnaround.",
+        equipment=("Steam boiler", "Steam pipes", "Enclosure covers"),
+    ),
+    "sprinkler": CuringMethod(
+        name="Continuous Sprinkler / Fog Misting",
+        cost_per_m3=120,
+        notes="Continuous fine water mist sprayed over the element surface.",
+        equipment=("Sprinkler system", "Water pump", "Timer control"),
+    ),
+}
+
+
+@lru_cache(maxsize=128)
+def _select_method(element_type: str, grade: str) -> tuple[str, int]:
+    """
+    Picks the curing method and base curing days for a normalised
+    (element_type, grade) pair. Pure, so results are memoised.
+    """
+
+    # Determine base curing days from grade
+    base_days = GRADE_CURING_DAYS.get(grade, 14)
+
+    # Select method by element type
+    method_key = ELEMENT_METHOD.get(element_type, "wet_covering")
+
+    # High-grade concrete → consider steam curing for precast
+    if grade in HIGH_GRADE_PRECAST and element_type in STEAM_ELIGIBLE_TYPES:
+        method_key = "steam_curing"
+        base_days = max(base_days - 7, 7)  # Steam curing accelerates
+
+    return method_key, base_days
+
+
+def _evaluate_rules(element_type: str, grade: str, low_wc: bool) -> tuple[str, int, str | None]:
+    method_key, base_days = _select_method(element_type, grade)
+
+    temperature_note = _LOW_WC_NOTE if low_wc else None
+    return method_key, base_days, temperature_note
+
+
+# Every (element_type, grade, low w/c) combination the rules know about,
+# evaluated once at import. Inputs outside this domain fall back to the rules.
+_PRECOMPUTED: dict[tuple[str, str, bool], tuple[str, int, str | None]] = {
+    (et.value, grade, low_wc): _evaluate_rules(et.value, grade, low_wc)
+    for et in ElementType
+    for grade in GRADE_CURING_DAYS
+    for low_wc in (False, True)
 }
 
 
@@ -65,38 +132,21 @@ def suggest_curing_method(
     volume = volume or 1.0
     element_type = (element_type or "slab").lower()
 
-    # Determine base curing days from grade
-    base_days = GRADE_CURING_DAYS.get(grade, 14)
-
-    # Select method by element type
-    if element_type in ("slab", "foundation"):
-        method_key = "ponding"
-    elif element_type in ("beam",):
-        method_key = "wet_covering"
-    elif element_type in ("column", "wall"):
-        method_key = "curing_compound"
-    elif element_type == "ceiling":
-        method_key = "sprinkler"
-    else:
-        method_key = "wet_covering"
-
-    # High-grade concrete → consider steam curing for precast
-    if grade in ("M40", "M45", "M50") and element_type in ("beam", "column"):
-        method_key = "steam_curing"
-        base_days = max(base_days - 7, 7)  # Steam curing accelerates
+    low_wc = bool(water_cement_ratio and water_cement_ratio < 0.4)
+    key = (element_type, grade, low_wc)
+    rule = _PRECOMPUTED.get(key)
+    if rule is None:
+        rule = _evaluate_rules(*key)
+    method_key, base_days, temperature_note = rule
 
     method = CURING_METHODS[method_key]
-    estimated_cost = round(method["cost_per_m3"] * volume, 2)
-
-    temperature_note = None
-    if water_cement_ratio and water_cement_ratio < 0.4:
-        temperature_note = "Low w/c ratio detected — ensure ambient temperature stays above 10°C during curing."
+    estimated_cost = round(method.cost_per_m3 * volume, 2)
 
-    return CuringSuggestion(
-        method=method["name"],
+    return CuringSuggestion.model_construct(
+        method=method.name,
         estimated_days=base_days,
         estimated_cost=estimated_cost,
-        notes=method["notes"],
+        notes=method.notes,
         temperature_requirement=temperature_note,
-        equipment_recommended=method["equipment"],
+        equipment_recommended=method.equipment,
     )
@@ -0,0 +1,31 @@
+import hashlib
+
+from fastapi import Request, Response
+
+
+def make_etag(payload: bytes) -> str:
+    """Strong ETag (quoted) derived from the serialized body."""
+    return f'"{hashlib.blake2b(payload, digest_size=8).hexdigest()}"'
+
+
+def if_none_match(request: Request, etag: str) -> bool:
+    """
+    True if the request's If-None-Match covers etag: `*`, or any listed tag
+    compared weakly (W/ prefixes ignored), with or without spaces after commas.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    for tag in header.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def etag_response(request: Request, payload: bytes, etag: str, cache_control: str) -> Response:
+    """Empty 304 when If-None-Match matches etag, else the payload as JSON."""
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if if_none_match(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=payload, media_type="application/json", headers=headers)
@@ -1,17 +1,18 @@
+import os
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from database import engine
 import models
 from routers import projects, elements, equipment, simulation, approximation
 
-# Create all tables
-models.Base.metadata.create_all(bind=engine)
-
 app = FastAPI(
     title="Precast Yard — Curing Optimizer API",
     description="Backend API for L&T Precast Yard concrete curing optimization.",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
 
 # CORS — allow Next.js dev server
@@ -30,6 +31,23 @@ app.include_router(simulation.router, prefix="/api")
 app.include_router(approximation.router, prefix="/api")
 
 
+@app.on_event("startup")
+def _init_db():
+    # Set AUTO_CREATE_TABLES=0 where the schema is managed outside the app
+    if os.getenv("AUTO_CREATE_TABLES", "1") == "1":
+        models.Base.metadata.create_all(bind=engine)
+
+
+@app.on_event("startup")
+def _warm_jit_kernels():
+    approximation.warm_up()
+
+
+@app.on_event("startup")
+def _train_simulator():
+    simulation.warm_up()
+
+
 @app.get("/")
 def root():
     return {"message": "Precast Yard API is running.", "docs": "/docs"}
@@ -1,6 +1,7 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text, Enum
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text, Enum, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
+from datetime import datetime, timezone
 import enum
 
 from database import Base
@@ -29,8 +30,20 @@ class CuringStatus(str, enum.Enum):
     COMPLETED = "completed"
 
 
+def _enum_column(enum_cls):
+    """Non-native Enum stored by value (e.g. "planning"), so existing rows still load."""
+    return Enum(
+        enum_cls,
+        native_enum=False,
+        length=16,
+        values_callable=lambda e: [m.value for m in e],
+        validate_strings=True,
+    )
+
+
 class Equipment(Base):
     __tablename__ = "equipment"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False)
@@ -39,32 +52,39 @@ class Equipment(Base):
     status = Column(String, default="available")  # available, in_use, maintenance
     quantity = Column(Integer, default=1)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Stamped on every UPDATE so the /equipment/ list ETag sees edits, not just inserts;
+    # set in Python for sub-second resolution (SQLite's now() is whole seconds)
+    updated_at = Column(DateTime(timezone=True), onupdate=lambda: datetime.now(timezone.utc))
 
 
 class Project(Base):
     __tablename__ = "projects"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False)
     location = Column(String, nullable=True)
     description = Column(Text, nullable=True)
-    status = Column(String, default=ProjectStatus.PLANNING)
+    status = Column(_enum_column(ProjectStatus), default=ProjectStatus.PLANNING)
     start_date = Column(String, nullable=True)
     end_date = Column(String, nullable=True)
     supervisor = Column(String, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
-    elements = relationship("Element", back_populates="project", cascade="all, delete-orphan")
+    # Callers must eager-load (selectinload) elements; an implicit lazy load raises
+    elements = relationship("Element", back_populates="project", cascade="all, delete-orphan", lazy="raise_on_sql")
 
 
 class Element(Base):
     __tablename__ = "elements"
+    __table_args__ = (Index("ix_elements_project_id_id", "project_id", "id"),)
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     project_id = Column(Integer, ForeignKey("projects.id"), nullable=False)
     name = Column(String, nullable=False)
-    type = Column(String, default=ElementType.SLAB)
+    type = Column(_enum_column(ElementType), default=ElementType.SLAB)
     description = Column(Text, nullable=True)
 
     # Physical dimensions
@@ -78,7 +98,7 @@ class Element(Base):
     water_cement_ratio = Column(Float, nullable=True)
 
     # Curing details
-    curing_status = Column(String, default=CuringStatus.PENDING)
+    curing_status = Column(_enum_column(CuringStatus), default=CuringStatus.PENDING)
     curing_method = Column(String, nullable=True)   # suggested by backend logic
     estimated_curing_days = Column(Integer, nullable=True)
     actual_curing_days = Column(Integer, nullable=True)
@@ -94,9 +114,15 @@ class Element(Base):
     project = relationship("Project", back_populates="elements")
     element_equipment = relationship("ElementEquipment", back_populates="element", cascade="all, delete-orphan")
 
+    @property
+    def element_equipment_ids(self):
+        # Junction row ids only — does not touch the equipment table
+        return [ee.id for ee in self.element_equipment]
+
 
 class ElementEquipment(Base):
     __tablename__ = "element_equipment"
+    __table_args__ = (Index("ix_element_equipment_element_id_id", "element_id", "id"),)
 
     id = Column(Integer, primary_key=True, index=True)
     element_id = Column(Integer, ForeignKey("elements.id"), nullable=False)
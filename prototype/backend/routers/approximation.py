@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Body
+import numpy as np
+from fastapi import APIRouter, Body, HTTPException
 from pydantic import BaseModel
 from typing import List, Literal
 from approximation_technique.linear_regression import linear_regression
@@ -14,12 +15,26 @@ class ApproximationRequest(BaseModel):
 class ApproximationResponse(BaseModel):
     function: str
 
+def warm_up():
+    """Compile (or load from cache) the jitted linear kernel before the first request."""
+    dummy = np.array([[0.0, 0.0], [1.0, 1.0], [2.0, 4.0], [3.0, 9.0]])
+    linear_regression(dummy, len(dummy))
+
 @router.post("/fit", response_model=ApproximationResponse)
 def fit_approximation(req: ApproximationRequest = Body(...)):
+    try:
+        points = np.asarray(req.points, dtype=np.float64)
+    except ValueError:  # ragged rows
+        points = None
+    if points is None or points.ndim != 2 or points.shape[1] < 2:
+        raise HTTPException(
+            status_code=422,
+            detail="points must be a list of [x, y] pairs of equal length",
+        )
     if req.method == "linear":
-        func_str = linear_regression(req.points, len(req.points))
+        func_str = linear_regression(points, len(points))
     elif req.method == "polynomial":
-        func_str = polynomial_regression(req.points, req.degree)
+        func_str = polynomial_regression(points, req.degree)
     else:
         raise ValueError("Unknown method")
     return {"function": func_str}
@@ -1,23 +1,12 @@
 import numpy as np
 
+
 def polynomial_regression(data_points , degree:int = 4):
-    rhs_list = []
-    lhs_list = []
-    print(degree)
-    for i in range(len(data_points)):
-        temp = []
-        for j in range(degree):  
-            temp.append(data_points[i][0]**j)  
-        lhs_list.append(temp)
-        rhs_list.append(data_points[i][1])
-    rhs = np.array(rhs_list)
-    lhs = np.array(lhs_list)
+    # data_points: float64 array of shape (n, 2)
+    x = data_points[:, 0]
+    rhs = data_points[:, 1]
+    lhs = np.vander(x, degree, increasing=True)  # columns x^0 … x^(degree-1)
     coefficients, *_ = np.linalg.lstsq(lhs , rhs, rcond=None)
-    res = ""
-    for i in range(len(coefficients)):
-        if i == len(coefficients) - 1:
-            res += str(round(coefficients[i], 2)) + " * (x ^ " + str(i) + ")"
-            break
-        res += str(round(coefficients[i], 2)) + " * (x ^ " + str(i) + ") + "
-    return res
-
+    return " + ".join(
+        f"{round(float(c), 2)} * (x ^ {i})" for i, c in enumerate(coefficients)
+    )
@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from typing import List
 
 from database import get_db
@@ -11,21 +11,26 @@ router = APIRouter(prefix="/projects/{project_id}/elements", tags=["Elements"])
 
 @router.get("/", response_model=List[schemas.ElementOut])
 def list_elements(project_id: int, db: Session = Depends(get_db)):
-    project = db.query(models.Project).filter(models.Project.id == project_id).first()
-    if not project:
+    exists = db.query(models.Project.id).filter(models.Project.id == project_id).scalar()
+    if exists is None:
         raise HTTPException(status_code=404, detail="Project not found")
-    return project.elements
+    # ElementOut nests element_equipment → equipment; load both levels with IN-lists, not per element
+    return (
+        db.query(models.Element)
+        .filter(models.Element.project_id == project_id)
+        .options(selectinload(models.Element.element_equipment).selectinload(models.ElementEquipment.equipment))
+        .all()
+    )
 
 
 @router.post("/", response_model=schemas.ElementOut, status_code=201)
 def create_element(project_id: int, element: schemas.ElementCreate, db: Session = Depends(get_db)):
-    project = db.query(models.Project).filter(models.Project.id == project_id).first()
+    project = db.get(models.Project, project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
-    db_element = models.Element(project_id=project_id, **element.model_dump())
+    db_element = models.Element(project_id=project_id, **element.__dict__)
     db.add(db_element)
     db.commit()
-    db.refresh(db_element)
     return db_element
 
 
@@ -48,10 +53,9 @@ def update_element(project_id: int, element_id: int, update: schemas.ElementUpda
     ).first()
     if not element:
         raise HTTPException(status_code=404, detail="Element not found")
-    for field, value in update.model_dump(exclude_unset=True).items():
-        setattr(element, field, value)
+    for field in update.model_fields_set:
+        setattr(element, field, getattr(update, field))
     db.commit()
-    db.refresh(element)
     return element
 
 
@@ -99,21 +103,20 @@ def add_equipment_to_element(
     payload: schemas.ElementEquipmentCreate,
     db: Session = Depends(get_db)
 ):
-    element = db.query(models.Element).filter(
+    element_exists = db.query(models.Element.id).filter(
         models.Element.id == element_id,
         models.Element.project_id == project_id
-    ).first()
-    if not element:
+    ).scalar()
+    if element_exists is None:
         raise HTTPException(status_code=404, detail="Element not found")
 
-    equipment = db.query(models.Equipment).filter(models.Equipment.id == payload.equipment_id).first()
+    equipment = db.get(models.Equipment, payload.equipment_id)
     if not equipment:
         raise HTTPException(status_code=404, detail="Equipment not found")
 
-    ee = models.ElementEquipment(element_id=element_id, **payload.model_dump())
+    ee = models.ElementEquipment(element_id=element_id, **payload.__dict__)
     db.add(ee)
     db.commit()
-    db.refresh(ee)
     return ee
 
 
@@ -1,24 +1,44 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from pydantic import TypeAdapter
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from typing import List
 
 from database import get_db
+from etag import if_none_match, make_etag
 import models, schemas
 
 router = APIRouter(prefix="/equipment", tags=["Equipment"])
 
+_equipment_list = TypeAdapter(List[schemas.EquipmentOut])
+
 
 @router.get("/", response_model=List[schemas.EquipmentOut])
-def list_equipment(db: Session = Depends(get_db)):
-    return db.query(models.Equipment).all()
+def list_equipment(request: Request, db: Session = Depends(get_db)):
+    """
+    Equipment list with an ETag derived from a cheap aggregate over the table
+    (row count, newest id, latest insert and update times). A matching
+    If-None-Match gets an empty 304 before any row is loaded or serialized.
+    """
+    version = db.query(
+        func.count(models.Equipment.id),
+        func.max(models.Equipment.id),
+        func.max(models.Equipment.created_at),
+        func.max(models.Equipment.updated_at),
+    ).one()
+    etag = make_etag(repr(tuple(version)).encode())
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if if_none_match(request, etag):
+        return Response(status_code=304, headers=headers)
+    items = _equipment_list.validate_python(db.query(models.Equipment).all(), from_attributes=True)
+    return Response(content=_equipment_list.dump_json(items), media_type="application/json", headers=headers)
 
 
 @router.post("/", response_model=schemas.EquipmentOut, status_code=201)
 def create_equipment(equipment: schemas.EquipmentCreate, db: Session = Depends(get_db)):
-    db_eq = models.Equipment(**equipment.model_dump())
+    db_eq = models.Equipment(**equipment.__dict__)
     db.add(db_eq)
     db.commit()
-    db.refresh(db_eq)
     return db_eq
 
 
@@ -35,10 +55,9 @@ def update_equipment(equipment_id: int, update: schemas.EquipmentUpdate, db: Ses
     eq = db.query(models.Equipment).filter(models.Equipment.id == equipment_id).first()
     if not eq:
         raise HTTPException(status_code=404, detail="Equipment not found")
-    for field, value in update.model_dump(exclude_unset=True).items():
-        setattr(eq, field, value)
+    for field in update.model_fields_set:
+        setattr(eq, field, getattr(update, field))
     db.commit()
-    db.refresh(eq)
     return eq
 
 
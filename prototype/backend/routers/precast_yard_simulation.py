@@ -31,7 +31,9 @@ CURING METHODS  (always evaluated for all 3)
 """
 
 import numpy as np
-from dataclasses import dataclass, asdict
+from numba import njit
+from dataclasses import dataclass, astuple
+from functools import lru_cache
 from typing import Optional
 from enum import IntEnum
 
@@ -77,20 +79,15 @@ class YardScenario:
     material_unit_cost:     float = 6500.0   # ₹/m³ (M35 concrete)
     overhead_pct:           float = 0.18     # 18% — typical India
 
-    def to_feature_vector(self, curing_method: int) -> np.ndarray:
-        return np.array([
-            self.num_elements,
-            self.element_complexity,
-            self.temperature,
-            self.humidity,
-            self.yard_area_m2,
-            self.equipment_availability,
-            self.water_budget_liters,
-            float(curing_method),           # injected per-method at predict time
-            self.concrete_m3,
-            self.material_unit_cost,
-            self.overhead_pct,
-        ], dtype=float)
+    def to_feature_matrix(self, curing_methods) -> np.ndarray:
+        """One feature row per entry of curing_methods, filled column-wise."""
+        cms    = np.asarray(curing_methods, dtype=float)
+        values = astuple(self)
+        X = np.empty((cms.size, len(values) + 1), dtype=np.float32)
+        X[:, :_CM_COL]     = values[:_CM_COL]
+        X[:, _CM_COL]      = cms
+        X[:, _CM_COL + 1:] = values[_CM_COL:]
+        return X
 
 
 # ─────────────────────────────────────────────────────────────
@@ -100,53 +97,59 @@ class YardScenario:
 _EQUIPMENT_DAY_COST = 18000.0   # ₹/day — crane + batching plant + vibrators
 
 
-def _ground_truth_for_method(s: YardScenario, cm: CuringMethod):
-    base_curing_days, water_per_m3, curing_cost_rate = _CURING_PROPS[cm]
-
+@njit(cache=True, fastmath=True)
+def _gt_kernel(num_elements, complexity, temperature, humidity, yard_area_m2,
+               equipment_availability, water_budget_liters, concrete_m3,
+               material_unit_cost, overhead_pct,
+               base_curing_days, water_per_m3, curing_cost_rate, fb_days, fb_rate):
     # ── Concurrent casting slots ──────────────────────────────
-    area_per_element = 5.0 + 2.0 * s.element_complexity
-    concurrent_slots = max(1, int(s.yard_area_m2 / area_per_element))
+    area_per_element = 5.0 + 2.0 * complexity
+    concurrent_slots = max(1, int(yard_area_m2 / area_per_element))
 
     # ── Daily production rate ─────────────────────────────────
-    base_rate   = s.equipment_availability * 2.5
-    complex_pen = 1.0 + (s.element_complexity - 1) * 0.18
+    base_rate   = equipment_availability * 2.5
+    complex_pen = 1.0 + (complexity - 1) * 0.18
     eff_rate    = max(0.1, min(base_rate / complex_pen, concurrent_slots))
 
-    temp_factor  = 1.0 - 0.008 * max(0, abs(s.temperature - 28))
-    humid_factor = 1.0 - 0.004 * max(0, s.humidity - 65)
+    temp_factor  = 1.0 - 0.008 * max(0.0, abs(temperature - 28))
+    humid_factor = 1.0 - 0.004 * max(0.0, humidity - 65)
     eff_rate    *= max(0.45, temp_factor) * max(0.55, humid_factor)
 
-    production_days = s.num_elements / eff_rate
+    production_days = num_elements / eff_rate
 
     # ── Curing days (env-adjusted) ────────────────────────────
-    env_factor  = 1.0 - 0.012 * max(0, s.temperature - 20) + 0.006 * max(0, 60 - s.humidity)
+    env_factor  = 1.0 - 0.012 * max(0.0, temperature - 20) + 0.006 * max(0.0, 60 - humidity)
     curing_days = base_curing_days * max(0.4, env_factor)
 
-    # Water budget check for water curing — fall back to chemical if insufficient
-    water_needed = s.concrete_m3 * water_per_m3
-    if cm == CuringMethod.WATER and water_needed > s.water_budget_liters:
-        fb_days, _, fb_rate = _CURING_PROPS[CuringMethod.CHEMICAL]
+    # Water budget check — fall back (fb_*) if insufficient
+    water_needed = concrete_m3 * water_per_m3
+    if water_needed > water_budget_liters:
         curing_days      = fb_days * max(0.4, env_factor)
         curing_cost_rate = fb_rate
 
     total_days = production_days + curing_days
 
     # ── Cost ₹ INR (material + equipment + curing — no labour) ──
-    material_cost  = s.concrete_m3 * s.material_unit_cost
-    equipment_cost = s.equipment_availability * _EQUIPMENT_DAY_COST * total_days
-    curing_cost    = s.concrete_m3 * curing_cost_rate * curing_days
+    material_cost  = concrete_m3 * material_unit_cost
+    equipment_cost = equipment_availability * _EQUIPMENT_DAY_COST * total_days
+    curing_cost    = concrete_m3 * curing_cost_rate * curing_days
     direct_cost    = material_cost + equipment_cost + curing_cost
-    total_cost     = direct_cost * (1 + s.overhead_pct)
+    total_cost     = direct_cost * (1 + overhead_pct)
 
-    return float(total_days), float(total_cost)
+    return total_days, total_cost
 
 
-def _ground_truth(s: YardScenario):
-    """Returns ground truth for all 3 curing methods."""
-    return {
-        CURING_LABELS[cm]: _ground_truth_for_method(s, cm)
-        for cm in CuringMethod
-    }
+def _method_constants(cm: CuringMethod):
+    """
+    (base_days, water_per_m3, cost_rate, fb_days, fb_rate) for _gt_kernel.
+    Only water curing falls back to chemical; the others "fall back" to themselves.
+    """
+    base_curing_days, water_per_m3, curing_cost_rate = _CURING_PROPS[cm]
+    if cm == CuringMethod.WATER:
+        fb_days, _, fb_rate = _CURING_PROPS[CuringMethod.CHEMICAL]
+    else:
+        fb_days, fb_rate = base_curing_days, curing_cost_rate
+    return base_curing_days, water_per_m3, curing_cost_rate, fb_days, fb_rate
 
 
 # ─────────────────────────────────────────────────────────────
@@ -169,24 +172,65 @@ SIGNAL_RANGES = {
 _INT_SIGNALS = {"num_elements"}
 
 
+_SIGNAL_LO = np.array([lo for lo, _ in SIGNAL_RANGES.values()], dtype=float)
+_SIGNAL_HI = np.array([hi for _, hi in SIGNAL_RANGES.values()], dtype=float)
+_INT_COLS  = [i for i, k in enumerate(SIGNAL_RANGES) if k in _INT_SIGNALS]
+_CM_COL    = 7   # curing_method position in the feature vector
+_FEATURE_COL = {k: i if i < _CM_COL else i + 1 for i, k in enumerate(SIGNAL_RANGES)}
+_CM_VALUES = np.array([cm.value for cm in CuringMethod], dtype=float)
+
+
+def sweep_values(signal: str, n_points: int) -> np.ndarray:
+    """n_points evenly spaced over the signal's range (rounded for integer signals)."""
+    lo, hi = SIGNAL_RANGES[signal]
+    values = np.linspace(lo, hi, n_points)
+    return np.round(values) if signal in _INT_SIGNALS else values
+
+
+# (n_methods, 5) rows of _method_constants, in CuringMethod order
+_METHOD_CONSTS = np.array([_method_constants(cm) for cm in CuringMethod], dtype=np.float64)
+
+
+@njit(cache=True, fastmath=True)
+def _gt_batch_kernel(S, consts):
+    n, m = S.shape[0], consts.shape[0]
+    total_days = np.empty((n, m))
+    total_cost = np.empty((n, m))
+    for i in range(n):
+        for j in range(m):
+            total_days[i, j], total_cost[i, j] = _gt_kernel(
+                S[i, 0], S[i, 1], S[i, 2], S[i, 3], S[i, 4],
+                S[i, 5], S[i, 6], S[i, 7], S[i, 8], S[i, 9],
+                consts[j, 0], consts[j, 1], consts[j, 2], consts[j, 3], consts[j, 4],
+            )
+    return total_days, total_cost
+
+
+def _ground_truth_batch(S: np.ndarray):
+    """
+    Ground truth for every row of S, an (N, 10) array of signals in
+    SIGNAL_RANGES order, under all curing methods at once.
+    Returns (total_days, total_cost), each (N, n_methods) with columns in CuringMethod order.
+    """
+    return _gt_batch_kernel(np.ascontiguousarray(S, dtype=np.float64), _METHOD_CONSTS)
+
+
 def _sample_signals(n_samples=3000, seed=42):
     """Sample across all signals + all 3 curing methods."""
     rng = np.random.default_rng(seed)
-    X, y_time, y_cost = [], [], []
-    for _ in range(n_samples):
-        vals = {
-            k: int(round(rng.uniform(lo, hi))) if k in _INT_SIGNALS
-            else float(rng.uniform(lo, hi))
-            for k, (lo, hi) in SIGNAL_RANGES.items()
-        }
-        s = YardScenario(**vals)
-        # Sample across all curing methods
-        for cm in CuringMethod:
-            t, c = _ground_truth_for_method(s, cm)
-            X.append(s.to_feature_vector(cm.value))
-            y_time.append(t * rng.uniform(0.97, 1.03))
-            y_cost.append(c * rng.uniform(0.97, 1.03))
-    return np.array(X), np.array(y_time), np.array(y_cost)
+    S = rng.uniform(_SIGNAL_LO, _SIGNAL_HI, size=(n_samples, len(SIGNAL_RANGES)))
+    S[:, _INT_COLS] = np.round(S[:, _INT_COLS])
+
+    # One row per (sample, curing method), sample-major like the feature rows
+    n_methods = len(CuringMethod)
+    X = np.insert(np.repeat(S, n_methods, axis=0), _CM_COL,
+                  np.tile(_CM_VALUES, n_samples), axis=1).astype(np.float32)
+    t, c   = _ground_truth_batch(S)       # (n_samples, n_methods) → same row order as X
+    y_time = t.ravel()
+    y_cost = c.ravel()
+    y_time *= rng.uniform(0.97, 1.03, size=y_time.shape)
+    y_cost *= rng.uniform(0.97, 1.03, size=y_cost.shape)
+    return X, y_time, y_cost
 
 
 # ─────────────────────────────────────────────────────────────
@@ -195,35 +239,68 @@ def _sample_signals(n_samples=3000, seed=42):
 
 class StandardScaler:
     def fit(self, X):
-        self.mean_ = X.mean(axis=0)
-        self.std_  = np.where(X.std(axis=0) == 0, 1.0, X.std(axis=0))
+        # Moments in float64, stored in X's dtype so transform keeps float32 inputs float32
+        self.mean_ = X.mean(axis=0, dtype=np.float64).astype(X.dtype)
+        std        = X.std(axis=0, dtype=np.float64)
+        self.std_  = np.where(std == 0, 1.0, std).astype(X.dtype)
         return self
     def transform(self, X):     return (X - self.mean_) / self.std_
     def fit_transform(self, X): return self.fit(X).transform(X)
 
 
 class PolynomialFeatures:
+    """Degree-2 expansion: [X, X², X_i·X_j for i < j]."""
     def __init__(self, degree=2): self.degree = degree
     def fit(self, X):
-        self._n = X.shape[1]; return self
+        self._n = X.shape[1]
+        self._iu, self._ju = np.triu_indices(self._n, k=1)
+        return self
     def transform(self, X):
-        cross = [
-            (X[:, i] * X[:, j]).reshape(-1, 1)
-            for i in range(X.shape[1]) for j in range(i + 1, X.shape[1])
-        ]
-        return np.hstack([X, X**2] + cross)
+        n, k = self._n, len(self._iu)
+        out = np.empty((X.shape[0], 2 * n + k), dtype=X.dtype)
+        out[:, :n] = X
+        np.multiply(X, X, out=out[:, n:2 * n])
+        np.multiply(X[:, self._iu], X[:, self._ju], out=out[:, 2 * n:])
+        return out
     def fit_transform(self, X): return self.fit(X).transform(X)
 
 
+def _ridge_weights(X, Y, alpha):
+    """Ridge normal equations (intercept unpenalised); Y may hold several target columns."""
+    Xb = np.hstack([X, np.ones((len(X), 1))])   # float64 ones → Gram and solve in float64
+    G  = Xb.T @ Xb                              # transposed self-product → BLAS syrk
+    G[np.diag_indices_from(G)] += alpha
+    G[-1, -1] -= alpha                          # intercept unpenalised
+    return np.linalg.solve(G, Xb.T @ Y)
+
+
 class RidgeRegression:
     def __init__(self, alpha=1.0): self.alpha = alpha
-    def fit(self, X, y):
-        Xb = np.hstack([X, np.ones((len(X), 1))])
-        reg = self.alpha * np.eye(Xb.shape[1]); reg[-1, -1] = 0.0
-        self.w_ = np.linalg.solve(Xb.T @ Xb + reg, Xb.T @ y)
+    def _set_weights(self, w):
+        # Split off the intercept so predict needs no bias column; inference runs in float32
+        self.w_     = w
+        self._wfeat = w[:-1].astype(np.float32)
+        self._b     = np.float32(w[-1])
         return self
+    def fit(self, X, y):
+        return self._set_weights(_ridge_weights(X, y, self.alpha))
+    @classmethod
+    def fit_shared(cls, X, ys, alpha=1.0):
+        """One model per target in ys, factorising the Gram matrix once for all of them."""
+        W = _ridge_weights(X, np.column_stack(ys), alpha)
+        return [cls(alpha)._set_weights(W[:, k].copy()) for k in range(W.shape[1])]
     def predict(self, X):
-        return np.hstack([X, np.ones((len(X), 1))]) @ self.w_
+        return X @ self._wfeat + self._b
+
+
+def _from_log(logp):
+    """
+    Invert the log1p target transform, clipping negatives first.
+    The float32 ridge output is upcast here, so expm1 and the reported
+    rupee/day figures carry float64 precision.
+    """
+    y = np.maximum(logp, 0.0, dtype=np.float64)
+    return np.expm1(y, out=y)
 
 
 class PolyRidgePipeline:
@@ -237,27 +314,39 @@ class PolyRidgePipeline:
         self.ridge.fit(Xp, np.log1p(y))
         return self
     def predict(self, X):
-        Xp   = self.poly.transform(self.scaler.transform(X))
-        logp = self.ridge.predict(Xp)
-        return np.expm1(np.clip(logp, 0, None))
+        Xp = self.poly.transform(self.scaler.transform(X))
+        return _from_log(self.ridge.predict(Xp))
 
 
 def r2_score(y_true, y_pred):
+    """R² of a 1-D target, or one R² per column for 2-D targets."""
+    if y_true.ndim == 2:
+        return np.array([r2_score(y_true[:, j], y_pred[:, j]) for j in range(y_true.shape[1])])
     ss_res = np.sum((y_true - y_pred) ** 2)
     ss_tot = np.sum((y_true - y_true.mean()) ** 2)
     return float(1 - ss_res / ss_tot) if ss_tot else 0.0
 
 
 def kfold_cv_r2(factory, X, y, k=5, seed=0):
+    """
+    Mean and std of the k-fold R². A 2-D y is fit as one multi-target model
+    per fold (one Gram + solve for all columns) and scored column-wise.
+    """
     rng   = np.random.default_rng(seed)
-    folds = np.array_split(rng.permutation(len(y)), k)
+    n     = len(y)
+    # Same folds as np.array_split over the permutation, as one label array
+    sizes = np.full(k, n // k); sizes[:n % k] += 1
+    fold_id = np.empty(n, dtype=np.int8)
+    fold_id[rng.permutation(n)] = np.repeat(np.arange(k), sizes)
     scores = []
     for i in range(k):
-        val   = folds[i]
-        train = np.concatenate([folds[j] for j in range(k) if j != i])
+        val   = fold_id == i
+        train = ~val
         m = factory(); m.fit(X[train], y[train])
         scores.append(r2_score(y[val], m.predict(X[val])))
     a = np.array(scores)
+    if a.ndim == 2:
+        return a.mean(axis=0), a.std(axis=0)
     return float(a.mean()), float(a.std())
 
 
@@ -265,34 +354,85 @@ def kfold_cv_r2(factory, X, y, k=5, seed=0):
 #  INVERSE SEARCH  (sweep: complexity × equipment per method)
 # ─────────────────────────────────────────────────────────────
 
-def _build_grid(base: YardScenario, cm: CuringMethod, step=4):
-    comp_r  = np.linspace(*SIGNAL_RANGES["element_complexity"],     500)[::step]
-    equip_r = np.linspace(*SIGNAL_RANGES["equipment_availability"],  500)[::step]
-    rows, meta = [], []
-    for cp in comp_r:
-        for eq in equip_r:
-            s = YardScenario(**{**asdict(base),
-                                "element_complexity":     float(cp),
-                                "equipment_availability": float(eq)})
-            rows.append(s.to_feature_vector(cm.value))
-            meta.append((round(float(cp), 2), round(float(eq), 3)))
-    return np.array(rows), meta
+# Coarse-then-fine: a _COARSE_N² sweep of the full ranges, then a _FINE_N²
+# sweep spanning one coarse cell either side of the coarse winner.
+_COARSE_N  = 15
+_FINE_N    = 25
+_GRID_ROWS = max(_COARSE_N, _FINE_N) ** 2
+_COMP_LO,  _COMP_HI  = SIGNAL_RANGES["element_complexity"]
+_EQUIP_LO, _EQUIP_HI = SIGNAL_RANGES["equipment_availability"]
+
+
+def _build_grid(base: YardScenario, cm: CuringMethod, comp_r, equip_r):
+    """
+    Feature rows for every (complexity, equipment) pair, complexity-major.
+    Returns (X, complexity, equipment) with one entry per row.
+    """
+    cp, eq  = np.meshgrid(comp_r, equip_r, indexing="ij")
+    cp, eq  = cp.ravel(), eq.ravel()
+    X = base.to_feature_matrix(np.full(cp.size, cm.value))
+    X[:, _FEATURE_COL["element_complexity"]]     = cp
+    X[:, _FEATURE_COL["equipment_availability"]] = eq
+    return X, cp, eq
+
 
+def _predict_both(X, model):
+    # model = (scaler, poly, ridge_time, ridge_cost); one feature expansion serves both ridges
+    scaler, poly, ridge_time, ridge_cost = model
+    Xp = poly.transform(scaler.transform(X))
+    return _from_log(ridge_time.predict(Xp)), _from_log(ridge_cost.predict(Xp))
 
-def _find_best_for_cost(target_cost, base, cm, model_time, model_cost):
-    X_grid, meta = _build_grid(base, cm)
-    t_pred = model_time.predict(X_grid)
-    c_pred = model_cost.predict(X_grid)
-    idx    = int(np.argmin(np.abs(c_pred - target_cost)))
-    return round(float(t_pred[idx]), 1), round(float(c_pred[idx]), 2), meta[idx]
 
+@lru_cache(maxsize=64)
+def _coarse_predictions(model, base_key: tuple, cm: CuringMethod):
+    """
+    (t_pred, c_pred, complexity, equipment) over the coarse full-range grid.
+    Independent of the search target, so repeat calls on a scenario skip the
+    feature expansion and matmul entirely. Arrays are read-only: they are shared.
+    """
+    X, cp, eq = _build_grid(YardScenario(*base_key), cm,
+                            np.linspace(_COMP_LO,  _COMP_HI,  _COARSE_N),
+                            np.linspace(_EQUIP_LO, _EQUIP_HI, _COARSE_N))
+    out = (*_predict_both(X, model), cp, eq)
+    for a in out:
+        a.flags.writeable = False
+    return out
 
-def _find_best_for_time(target_days, base, cm, model_time, model_cost):
-    X_grid, meta = _build_grid(base, cm)
-    t_pred = model_time.predict(X_grid)
-    c_pred = model_cost.predict(X_grid)
-    idx    = int(np.argmin(np.abs(t_pred - target_days)))
-    return round(float(t_pred[idx]), 1), round(float(c_pred[idx]), 2), meta[idx]
+
+def _fine_axes(cp: float, eq: float):
+    dc = (_COMP_HI  - _COMP_LO)  / (_COARSE_N - 1)
+    de = (_EQUIP_HI - _EQUIP_LO) / (_COARSE_N - 1)
+    return (np.linspace(max(_COMP_LO,  cp - dc), min(_COMP_HI,  cp + dc), _FINE_N),
+            np.linspace(max(_EQUIP_LO, eq - de), min(_EQUIP_HI, eq + de), _FINE_N))
+
+
+def _best_at(idx, t_pred, c_pred, cp, eq):
+    return (round(float(t_pred[idx]), 1), round(float(c_pred[idx]), 2),
+            (round(float(cp[idx]), 2), round(float(eq[idx]), 3)))
+
+
+def _nearest(pred, target, buf=None):
+    """Index of the entry of pred closest to target; |pred - target| is built in buf."""
+    diff = np.subtract(pred, target, out=None if buf is None else buf[:pred.size])
+    return int(np.argmin(np.abs(diff, out=diff)))
+
+
+def _search(target, base, cm, model, match, buf=None):
+    """Coarse-then-fine search; match = 0 matches predicted days, 1 predicted cost."""
+    t_pred, c_pred, cp, eq = _coarse_predictions(model, astuple(base), cm)
+    idx = _nearest((t_pred, c_pred)[match], target, buf)
+    X, cp, eq = _build_grid(base, cm, *_fine_axes(cp[idx], eq[idx]))
+    t_pred, c_pred = _predict_both(X, model)
+    idx = _nearest((t_pred, c_pred)[match], target, buf)
+    return _best_at(idx, t_pred, c_pred, cp, eq)
+
+
+def _find_best_for_cost(target_cost, base, cm, model, buf=None):
+    return _search(target_cost, base, cm, model, 1, buf)
+
+
+def _find_best_for_time(target_days, base, cm, model, buf=None):
+    return _search(target_days, base, cm, model, 0, buf)
 
 
 # ─────────────────────────────────────────────────────────────
@@ -305,14 +445,51 @@ def _inr(amount: float) -> str:
     return f"₹{amount:,.0f}"
 
 
+# ─────────────────────────────────────────────────────────────
+#  MEMOISED CORES  (keyed on the fitted model tuple + scenario tuple)
+# ─────────────────────────────────────────────────────────────
+# The model tuple hashes by identity, so retraining never hits stale entries.
+# Rows are returned as tuples of dicts; callers copy before handing them out.
+
+@lru_cache(maxsize=1024)
+def _evaluate_rows(model, scenario_key: tuple):
+    s = YardScenario(*scenario_key)
+    t_pred, c_pred = _predict_both(s.to_feature_matrix(_CM_VALUES), model)
+    t_gt, c_gt     = _ground_truth_batch(np.array([scenario_key]))
+    return tuple({
+        "curing_method":    CURING_LABELS[cm],
+        "predicted_days":   round(float(t_pred[cm.value]), 1),
+        "predicted_cost":   round(float(c_pred[cm.value]), 2),
+        "groundtruth_days": round(float(t_gt[0, cm.value]), 1),
+        "groundtruth_cost": round(float(c_gt[0, cm.value]), 2),
+    } for cm in CuringMethod)
+
+
+@lru_cache(maxsize=1024)
+def _inverse_rows(model, find_best, target: float, scenario_key: tuple):
+    """find_best is _find_best_for_cost or _find_best_for_time."""
+    s = YardScenario(*scenario_key)
+    buf = np.empty(_GRID_ROWS)   # shared by all 3 method searches
+    results = []
+    for cm in CuringMethod:
+        t, c, (cp, eq) = find_best(target, s, cm, model, buf)
+        results.append({
+            "curing_method":              CURING_LABELS[cm],
+            "predicted_days":             t,
+            "predicted_cost":             c,
+            "recommended_complexity":     cp,
+            "recommended_equip":          eq,
+        })
+    return tuple(results)
+
+
 # ─────────────────────────────────────────────────────────────
 #  PUBLIC SIMULATOR
 # ─────────────────────────────────────────────────────────────
 
 class PrecastYardSimulator:
     def __init__(self):
-        self._model_time = None
-        self._model_cost = None
+        self._model      = None   # (scaler, poly, ridge_time, ridge_cost)
         self._trained    = False
         self.default_scenario = YardScenario()
 
@@ -324,12 +501,19 @@ class PrecastYardSimulator:
             print("=" * 60)
             print(f"  Sampling {n_samples} scenarios × 3 curing methods …")
         X, y_time, y_cost = _sample_signals(n_samples, seed)
-        self._model_time = PolyRidgePipeline(poly_degree, alpha).fit(X, y_time)
-        self._model_cost = PolyRidgePipeline(poly_degree, alpha).fit(X, y_cost)
+        # Time and cost share one scaler + poly expansion and one ridge solve
+        scaler = StandardScaler()
+        poly   = PolynomialFeatures(poly_degree)
+        Xp     = poly.fit_transform(scaler.fit_transform(X))
+        ridge_time, ridge_cost = RidgeRegression.fit_shared(
+            Xp, [np.log1p(y_time), np.log1p(y_cost)], alpha)
+        self._model = (scaler, poly, ridge_time, ridge_cost)
+        # Entries keyed on a previous model can never hit again; drop them
+        for cache in (_coarse_predictions, _evaluate_rows, _inverse_rows):
+            cache.cache_clear()
         if verbose:
             f = lambda: PolyRidgePipeline(poly_degree, alpha)
-            mt, st = kfold_cv_r2(f, X, y_time)
-            mc, sc = kfold_cv_r2(f, X, y_cost)
+            (mt, mc), (st, sc) = kfold_cv_r2(f, X, np.column_stack([y_time, y_cost]))
             print(f"  Time model R² (5-fold): {mt:.4f} ± {st:.4f}")
             print(f"  Cost model R² (5-fold): {mc:.4f} ± {sc:.4f}")
             print("  Done.\n")
@@ -346,20 +530,7 @@ class PrecastYardSimulator:
         """Returns predicted time + cost for every curing method."""
         self._check()
         s = scenario or self.default_scenario
-        results = []
-        for cm in CuringMethod:
-            x      = s.to_feature_vector(cm.value).reshape(1, -1)
-            t_pred = round(float(self._model_time.predict(x)[0]), 1)
-            c_pred = round(float(self._model_cost.predict(x)[0]), 2)
-            t_gt, c_gt = _ground_truth_for_method(s, cm)
-            results.append({
-                "curing_method":    CURING_LABELS[cm],
-                "predicted_days":   t_pred,
-                "predicted_cost":   c_pred,
-                "groundtruth_days": round(t_gt, 1),
-                "groundtruth_cost": round(c_gt, 2),
-            })
-        return results
+        return [dict(r) for r in _evaluate_rows(self._model, astuple(s))]
 
     # ── Given budget → time for each curing method ───────────
 
@@ -367,20 +538,13 @@ class PrecastYardSimulator:
         """Given a budget, returns predicted days for each curing method."""
         self._check()
         s = scenario or self.default_scenario
-        results = []
-        for cm in CuringMethod:
-            t, c, (cp, eq) = _find_best_for_cost(budget, s, cm,
-                                                   self._model_time, self._model_cost)
-            results.append({
-                "curing_method":              CURING_LABELS[cm],
-                "predicted_days":             t,
-                "predicted_cost":             c,
-                "recommended_complexity":     cp,
-                "recommended_equip":          eq,
-            })
-            if verbose:
-                print(f"  [{CURING_LABELS[cm]:>8}]  {_inr(budget)}  →  {t} days  "
-                      f"/ {_inr(c)}  (complexity={cp}, equip={eq:.0%})")
+        results = [dict(r) for r in _inverse_rows(self._model, _find_best_for_cost,
+                                                  budget, astuple(s))]
+        if verbose:
+            for r in results:
+                print(f"  [{r['curing_method']:>8}]  {_inr(budget)}  →  {r['predicted_days']} days  "
+                      f"/ {_inr(r['predicted_cost'])}  (complexity={r['recommended_complexity']}, "
+                      f"equip={r['recommended_equip']:.0%})")
         return results
 
     # ── Given days → cost for each curing method ─────────────
@@ -389,39 +553,47 @@ class PrecastYardSimulator:
         """Given target days, returns predicted cost for each curing method."""
         self._check()
         s = scenario or self.default_scenario
-        results = []
-        for cm in CuringMethod:
-            t, c, (cp, eq) = _find_best_for_time(days, s, cm,
-                                                   self._model_time, self._model_cost)
-            results.append({
-                "curing_method":              CURING_LABELS[cm],
-                "predicted_days":             t,
-                "predicted_cost":             c,
-                "recommended_complexity":     cp,
-                "recommended_equip":          eq,
-            })
-            if verbose:
-                print(f"  [{CURING_LABELS[cm]:>8}]  {days} days  →  {_inr(c)}  "
-                      f"/ {t} days actual  (complexity={cp}, equip={eq:.0%})")
+        results = [dict(r) for r in _inverse_rows(self._model, _find_best_for_time,
+                                                  days, astuple(s))]
+        if verbose:
+            for r in results:
+                print(f"  [{r['curing_method']:>8}]  {days} days  →  {_inr(r['predicted_cost'])}  "
+                      f"/ {r['predicted_days']} days actual  (complexity={r['recommended_complexity']}, "
+                      f"equip={r['recommended_equip']:.0%})")
         return results
 
     # ── Sensitivity for a single signal ──────────────────────
 
-    def sensitivity(self, signal, n_points=10, scenario=None) -> list[dict]:
+    def sensitivity_batch(self, signal, values, scenario=None) -> np.ndarray:
+        """
+        Predicted (days, cost) at each value of one signal, for every curing method,
+        from a single predict over all rows. Returns an (n_values, n_methods, 2) array.
+        """
         self._check()
         if signal not in SIGNAL_RANGES:
             raise ValueError(f"Unknown signal. Choose from: {list(SIGNAL_RANGES)}")
-        lo, hi = SIGNAL_RANGES[signal]
-        base   = asdict(scenario or self.default_scenario)
-        out    = []
-        for v in np.linspace(lo, hi, n_points):
-            val  = int(round(v)) if signal in _INT_SIGNALS else float(v)
-            row  = {signal: val}
-            s    = YardScenario(**{**base, signal: val})
+        s = scenario or self.default_scenario
+
+        # All (value, curing method) rows in one batch, value-major
+        n_values, n_methods = len(values), len(CuringMethod)
+        X = s.to_feature_matrix(np.tile(_CM_VALUES, n_values))
+        X[:, _FEATURE_COL[signal]] = np.repeat(values, n_methods)
+        t_pred, c_pred = _predict_both(X, self._model)
+        return np.stack([t_pred, c_pred], axis=-1).reshape(n_values, n_methods, 2)
+
+    def sensitivity(self, signal, n_points=10, scenario=None) -> list[dict]:
+        if signal not in SIGNAL_RANGES:
+            raise ValueError(f"Unknown signal. Choose from: {list(SIGNAL_RANGES)}")
+        values = sweep_values(signal, n_points)
+        pred   = self.sensitivity_batch(signal, values, scenario).tolist()
+
+        out = []
+        for v, per_method in zip(values, pred):
+            row = {signal: int(v) if signal in _INT_SIGNALS else float(v)}
             for cm in CuringMethod:
-                x = s.to_feature_vector(cm.value).reshape(1, -1)
-                row[f"{CURING_LABELS[cm]}_days"] = round(float(self._model_time.predict(x)[0]), 1)
-                row[f"{CURING_LABELS[cm]}_cost"] = round(float(self._model_cost.predict(x)[0]), 2)
+                days, cost = per_method[cm.value]
+                row[f"{CURING_LABELS[cm]}_days"] = round(days, 1)
+                row[f"{CURING_LABELS[cm]}_cost"] = round(cost, 2)
             out.append(row)
         return out
 
@@ -1,6 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import func
+from sqlalchemy.orm import Session, selectinload
+from typing import List, Literal, Optional
 
 from database import get_db
 import models, schemas
@@ -8,11 +10,33 @@ import models, schemas
 router = APIRouter(prefix="/projects", tags=["Projects"])
 
 
+def _load_project(db: Session, project_id: int, expand_equipment: bool = False):
+    """
+    Fetch a project with its elements and their equipment links, one extra
+    IN-list query per level; the equipment rows themselves only when expanding.
+    populate_existing so the eager load also runs for rows already in the session.
+    """
+    links = selectinload(models.Project.elements).selectinload(models.Element.element_equipment)
+    if expand_equipment:
+        links = links.selectinload(models.ElementEquipment.equipment)
+    return db.get(
+        models.Project, project_id,
+        options=[links],
+        populate_existing=True,
+    )
+
+
 @router.get("/", response_model=List[schemas.ProjectSummary])
 def list_projects(db: Session = Depends(get_db)):
-    projects = db.query(models.Project).all()
+    # Count elements in SQL rather than loading them just to take len()
+    rows = (
+        db.query(models.Project, func.count(models.Element.id))
+        .outerjoin(models.Project.elements)
+        .group_by(models.Project.id)
+        .all()
+    )
     result = []
-    for p in projects:
+    for p, element_count in rows:
         summary = schemas.ProjectSummary(
             id=p.id,
             name=p.name,
@@ -23,7 +47,7 @@ def list_projects(db: Session = Depends(get_db)):
             end_date=p.end_date,
             supervisor=p.supervisor,
             created_at=p.created_at,
-            element_count=len(p.elements),
+            element_count=element_count,
         )
         result.append(summary)
     return result
@@ -31,36 +55,49 @@ def list_projects(db: Session = Depends(get_db)):
 
 @router.post("/", response_model=schemas.ProjectOut, status_code=201)
 def create_project(project: schemas.ProjectCreate, db: Session = Depends(get_db)):
-    db_project = models.Project(**project.model_dump())
+    # New project, so its elements are known to be empty — no need to load them
+    db_project = models.Project(**project.__dict__, elements=[])
     db.add(db_project)
     db.commit()
-    db.refresh(db_project)
     return db_project
 
 
-@router.get("/{project_id}", response_model=schemas.ProjectOut)
-def get_project(project_id: int, db: Session = Depends(get_db)):
-    project = db.query(models.Project).filter(models.Project.id == project_id).first()
+@router.get(
+    "/{project_id}",
+    response_model=schemas.ProjectOut,
+    responses={200: {"model": schemas.ProjectOutExpanded,
+                     "description": "Elements carry full equipment details with ?expand=equipment"}},
+)
+def get_project(
+    project_id: int,
+    expand: Optional[Literal["equipment"]] = Query(None),
+    db: Session = Depends(get_db),
+):
+    project = _load_project(db, project_id, expand_equipment=expand == "equipment")
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
+    if expand:
+        return ORJSONResponse(schemas.ProjectOutExpanded.model_validate(project).model_dump(mode="json"))
     return project
 
 
 @router.put("/{project_id}", response_model=schemas.ProjectOut)
 def update_project(project_id: int, update: schemas.ProjectUpdate, db: Session = Depends(get_db)):
-    project = db.query(models.Project).filter(models.Project.id == project_id).first()
-    if not project:
+    values = update.model_dump(exclude_unset=True)
+    if values:
+        # Single UPDATE statement; the row count doubles as the existence check
+        found = db.query(models.Project).filter_by(id=project_id).update(values)
+        db.commit()
+    else:
+        found = db.get(models.Project, project_id) is not None
+    if not found:
         raise HTTPException(status_code=404, detail="Project not found")
-    for field, value in update.model_dump(exclude_unset=True).items():
-        setattr(project, field, value)
-    db.commit()
-    db.refresh(project)
-    return project
+    return _load_project(db, project_id)
 
 
 @router.delete("/{project_id}", status_code=204)
 def delete_project(project_id: int, db: Session = Depends(get_db)):
-    project = db.query(models.Project).filter(models.Project.id == project_id).first()
+    project = db.get(models.Project, project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     db.delete(project)
@@ -4,8 +4,9 @@
 =============================================================
   Include in your main.py:
 
-      from precast_yard_router import router as precast_router
+      from precast_yard_router import router as precast_router, warm_up
       app.include_router(precast_router)
+      app.add_event_handler("startup", warm_up)
 
   All signals passed as JSON body.
   All monetary values in ₹ INR.
@@ -17,19 +18,27 @@
       POST /precast/evaluate
       POST /precast/predict/time      (budget → days  × 3 methods)
       POST /precast/predict/cost      (days   → cost  × 3 methods)
-      POST /precast/sensitivity/{signal}
+      POST /precast/sensitivity/{signal}  (Accept: application/x-ndjson to stream rows)
 =============================================================
 """
 
 from __future__ import annotations
 
+import dataclasses
 import os
 import sys
 import time
-from typing import Any
+from functools import lru_cache, wraps
+from operator import attrgetter
+from typing import get_type_hints
 
-from fastapi import APIRouter, Body, HTTPException
-from pydantic import BaseModel, Field, field_validator
+import orjson
+from fastapi import APIRouter, Body, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field, SerializeAsAny, TypeAdapter, field_validator
+
+from etag import etag_response, make_etag
 
 sys.path.insert(0, os.path.dirname(__file__))
 from precast_yard_simulation import (
@@ -38,22 +47,27 @@ from precast_yard_simulation import (
     SIGNAL_RANGES,
     CuringMethod,
     CURING_LABELS,
+    sweep_values,
 )
 
 # ─────────────────────────────────────────────────────────────
-#  SINGLETON — lazy-train on first request
+#  SINGLETON — trained once at startup (see warm_up)
 # ─────────────────────────────────────────────────────────────
 
 _simulator    = PrecastYardSimulator()
 _training_sec = 0.0
 
 
-def _get_simulator() -> PrecastYardSimulator:
+def warm_up():
+    """Train the simulator during app startup so no request pays for it."""
     global _training_sec
     if not _simulator._trained:
         t0 = time.perf_counter()
         _simulator.train(n_samples=4000, verbose=False)
         _training_sec = round(time.perf_counter() - t0, 2)
+
+
+def _get_simulator() -> PrecastYardSimulator:
     return _simulator
 
 
@@ -66,7 +80,10 @@ class ScenarioBody(BaseModel):
     All 10 precast yard signals.
     curing_method is NOT an input — results are always returned
     for water, steam, and chemical curing simultaneously.
+    Frozen (hashable, usable as a cache key) and strict about unknown fields.
     """
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     num_elements:           int   = Field(50,      ge=5,    le=300,  description="Number of precast elements to produce")
     element_complexity:     float = Field(4.0,     ge=1.0,  le=10.0, description="Complexity 1 (simple slab) → 10 (complex façade); encodes size & dimensions")
     temperature:            float = Field(32.0,    ge=10.0, le=45.0, description="Ambient temperature in °C (Indian sites typically 25–40°C)")
@@ -79,8 +96,13 @@ class ScenarioBody(BaseModel):
     overhead_pct:           float = Field(0.18,    ge=0.10, le=0.30, description="Overhead as fraction of direct cost (typical India: 15–25%)")
 
     def to_scenario(self) -> YardScenario:
-        _scenario_fields = set(YardScenario.__dataclass_fields__.keys())
-        return YardScenario(**{k: v for k, v in self.model_dump().items() if k in _scenario_fields})
+        return YardScenario(*_scenario_args(self))
+
+
+# YardScenario's fields in dataclass order, read off the body in one C-level call
+# and passed positionally (no kwargs dict per request)
+_SCENARIO_FIELDS = tuple(f.name for f in dataclasses.fields(YardScenario))
+_scenario_args   = attrgetter(*_SCENARIO_FIELDS)
 
 
 class PredictTimeBody(ScenarioBody):
@@ -99,6 +121,9 @@ class SensitivityBody(ScenarioBody):
 #  RESPONSE MODELS
 # ─────────────────────────────────────────────────────────────
 
+# The request body echoed back as-is (subclass fields such as budget included)
+_ScenarioEcho = SerializeAsAny[ScenarioBody]
+
 class HealthResponse(BaseModel):
     status:                str
     model_trained:         bool
@@ -137,31 +162,32 @@ class EvaluateResult(BaseModel):
 
 class EvaluateResponse(BaseModel):
     results:  list[EvaluateResult]
-    scenario: dict[str, Any]
+    scenario: _ScenarioEcho
 
 class PredictTimeResponse(BaseModel):
     input_budget: float
     results:      list[CuringResultWithConfig]
-    scenario:     dict[str, Any]
+    scenario:     _ScenarioEcho
 
 class PredictCostResponse(BaseModel):
     input_days: float
     results:    list[CuringResultWithConfig]
-    scenario:   dict[str, Any]
-
-class SensitivityPoint(BaseModel):
-    value:            float
-    water_days:       float
-    water_cost:       float
-    steam_days:       float
-    steam_cost:       float
-    chemical_days:    float
-    chemical_cost:    float
+    scenario:   _ScenarioEcho
+
+# Columnar: one list per series, all of length n_points (index i = i-th sweep value)
+class SensitivityColumns(BaseModel):
+    value:            list[float]
+    water_days:       list[float]
+    water_cost:       list[float]
+    steam_days:       list[float]
+    steam_cost:       list[float]
+    chemical_days:    list[float]
+    chemical_cost:    list[float]
 
 class SensitivityResponse(BaseModel):
     signal:  str
-    points:  list[SensitivityPoint]
-    scenario: dict[str, Any]
+    points:  SensitivityColumns
+    scenario: _ScenarioEcho
 
 
 # ─────────────────────────────────────────────────────────────
@@ -182,48 +208,162 @@ _SIGNAL_META: dict[str, dict] = {
 }
 
 
+# Signal-name check for /sensitivity, built once rather than per (invalid) request
+_SIGNAL_NAMES       = frozenset(SIGNAL_RANGES)
+_VALID_SIGNALS_TEXT = str(list(SIGNAL_RANGES))
+
+
+# Static, so serialised once at import; /signals just returns the bytes
+_SIGNALS_PAYLOAD = orjson.dumps(SignalsResponse(
+    signals=[
+        SignalInfo(
+            name        = name,
+            type        = _SIGNAL_META[name]["type"],
+            min         = float(lo),
+            max         = float(hi),
+            description = _SIGNAL_META[name]["description"],
+        )
+        for name, (lo, hi) in SIGNAL_RANGES.items()
+    ],
+    curing_methods={str(cm.value): CURING_LABELS[cm] for cm in CuringMethod},
+).model_dump(mode="json"))
+_SIGNALS_ETAG = make_etag(_SIGNALS_PAYLOAD)
+
+
+@lru_cache(maxsize=4)
+def _health_payload(trained: bool, training_sec: float) -> tuple[bytes, str]:
+    """/health body + ETag; only changes once, when training finishes."""
+    payload = orjson.dumps(HealthResponse(
+        status="ok",
+        model_trained=trained,
+        training_time_seconds=training_sec,
+    ).model_dump(mode="json"))
+    return payload, make_etag(payload)
+
+
 # ─────────────────────────────────────────────────────────────
-#  ROUTER
+#  RESPONSE CACHE  — serialised bytes keyed on the request body
 # ─────────────────────────────────────────────────────────────
+# Simulator output is trusted, so result models are built with
+# model_construct (no per-row validation).
 
-router = APIRouter(prefix="/precast", tags=["Precast Yard Simulation"])
+def _cached_response(build):
+    """
+    Wrap build(body, *extra) -> response model so identical requests
+    return the cached JSON bytes without touching the simulator.
+    Bodies are frozen, so they hash by class + field values and key the cache directly.
+    build returns a model_construct-ed response; a TypeAdapter for its annotated
+    return class dumps it, echoed body included, straight to JSON bytes in one
+    pass — no intermediate dicts and no str → bytes re-encode.
+    """
+    adapter = TypeAdapter(get_type_hints(build)["return"])
 
+    @lru_cache(maxsize=1024)
+    def _payload(body: ScenarioBody, *extra) -> bytes:
+        return adapter.dump_json(build(body, *extra))
 
-@router.get("/health", response_model=HealthResponse, summary="Model readiness check")
-def health():
-    sim = _get_simulator()
-    return HealthResponse(
-        status="ok",
-        model_trained=sim._trained,
-        training_time_seconds=_training_sec,
+    @wraps(build)
+    def wrapper(body: ScenarioBody, *extra) -> Response:
+        return Response(content=_payload(body, *extra), media_type="application/json")
+
+    wrapper.cache_clear = _payload.cache_clear
+    return wrapper
+
+
+@_cached_response
+def _evaluate_response(body: ScenarioBody) -> EvaluateResponse:
+    raw = _get_simulator().evaluate(body.to_scenario())
+    return EvaluateResponse(
+        results=[EvaluateResult.model_construct(**r) for r in raw],
+        scenario=body,
     )
 
 
-@router.get("/signals", response_model=SignalsResponse, summary="All signals with valid ranges")
-def list_signals():
+@_cached_response
+def _predict_time_response(body: PredictTimeBody) -> PredictTimeResponse:
+    raw = _get_simulator().predict_time(budget=body.budget, scenario=body.to_scenario(), verbose=False)
+    return PredictTimeResponse(
+        input_budget = body.budget,
+        results      = [CuringResultWithConfig.model_construct(**r) for r in raw],
+        scenario     = body,
+    )
+
+
+@_cached_response
+def _predict_cost_response(body: PredictCostBody) -> PredictCostResponse:
+    raw = _get_simulator().predict_cost(days=body.days, scenario=body.to_scenario(), verbose=False)
+    return PredictCostResponse(
+        input_days = body.days,
+        results    = [CuringResultWithConfig.model_construct(**r) for r in raw],
+        scenario   = body,
+    )
+
+
+def _sensitivity_grid(body: SensitivityBody, signal: str) -> dict[str, list]:
+    """
+    Whole sweep in one batched predict, as rounded SensitivityColumns lists
+    keyed value, water_days, water_cost, ...
+    """
+    values = sweep_values(signal, body.n_points)
+    pred   = _get_simulator().sensitivity_batch(signal, values, body.to_scenario())
+    cols = {"value": [float(v) for v in values]}
+    for cm in CuringMethod:
+        label = CURING_LABELS[cm]
+        cols[f"{label}_days"] = [round(d, 1) for d in pred[:, cm.value, 0].tolist()]
+        cols[f"{label}_cost"] = [round(c, 2) for c in pred[:, cm.value, 1].tolist()]
+    return cols
+
+
+@_cached_response
+def _sensitivity_response(body: SensitivityBody, signal: str) -> SensitivityResponse:
+    return SensitivityResponse(
+        signal   = signal,
+        points   = SensitivityColumns.model_construct(**_sensitivity_grid(body, signal)),
+        scenario = body,
+    )
+
+
+async def _ndjson_points(cols: dict[str, list]):
+    """One JSON object per sweep point, newline-terminated; the grid is already computed."""
+    keys = tuple(cols)
+    for row in zip(*cols.values()):
+        yield orjson.dumps(dict(zip(keys, row))) + b"\n"
+
+
+# ─────────────────────────────────────────────────────────────
+#  ROUTER
+# ─────────────────────────────────────────────────────────────
+
+NDJSON = "application/x-ndjson"
+
+router = APIRouter(
+    prefix="/precast",
+    tags=["Precast Yard Simulation"],
+    default_response_class=ORJSONResponse,
+)
+
+
+@router.get("/health", responses={200: {"model": HealthResponse}}, summary="Model readiness check")
+def health(request: Request):
+    """Polled by dashboards; repeat polls with If-None-Match get an empty 304."""
+    payload, etag = _health_payload(_get_simulator()._trained, _training_sec)
+    return etag_response(request, payload, etag, "no-cache")
+
+
+@router.get("/signals", responses={200: {"model": SignalsResponse}}, summary="All signals with valid ranges")
+def list_signals(request: Request):
     """
     Returns every accepted signal with its valid range, type, and description.
     Use this to build forms dynamically on the frontend.
     Note: curing_method is NOT an input signal — all 3 methods are always evaluated.
+    Static per deployment, so it carries an ETag and may be cached for 5 minutes.
     """
-    return SignalsResponse(
-        signals=[
-            SignalInfo(
-                name        = name,
-                type        = _SIGNAL_META[name]["type"],
-                min         = float(lo),
-                max         = float(hi),
-                description = _SIGNAL_META[name]["description"],
-            )
-            for name, (lo, hi) in SIGNAL_RANGES.items()
-        ],
-        curing_methods={str(cm.value): CURING_LABELS[cm] for cm in CuringMethod},
-    )
+    return etag_response(request, _SIGNALS_PAYLOAD, _SIGNALS_ETAG, "public, max-age=300")
 
 
 @router.post(
     "/evaluate",
-    response_model=EvaluateResponse,
+    responses={200: {"model": EvaluateResponse}},
     summary="Predict time & cost for all 3 curing methods",
 )
 def evaluate(body: ScenarioBody = Body(...)):
@@ -231,17 +371,12 @@ def evaluate(body: ScenarioBody = Body(...)):
     Direct evaluation — returns predicted **and** ground-truth time + cost
     for **all 3 curing methods** (water, steam, chemical) side by side.
     """
-    sim     = _get_simulator()
-    raw     = sim.evaluate(body.to_scenario())
-    return EvaluateResponse(
-        results=[EvaluateResult(**r) for r in raw],
-        scenario=body.model_dump(),
-    )
+    return _evaluate_response(body)
 
 
 @router.post(
     "/predict/time",
-    response_model=PredictTimeResponse,
+    responses={200: {"model": PredictTimeResponse}},
     summary="Cost → Time: given a budget, return expected days per curing method",
 )
 def predict_time(body: PredictTimeBody = Body(...)):
@@ -250,18 +385,12 @@ def predict_time(body: PredictTimeBody = Body(...)):
     for each of the 3 curing methods, along with the recommended
     complexity and equipment configuration for that budget.
     """
-    sim = _get_simulator()
-    raw = sim.predict_time(budget=body.budget, scenario=body.to_scenario(), verbose=False)
-    return PredictTimeResponse(
-        input_budget = body.budget,
-        results      = [CuringResultWithConfig(**r) for r in raw],
-        scenario     = body.model_dump(),
-    )
+    return _predict_time_response(body)
 
 
 @router.post(
     "/predict/cost",
-    response_model=PredictCostResponse,
+    responses={200: {"model": PredictCostResponse}},
     summary="Time → Cost: given a deadline, return expected cost per curing method",
 )
 def predict_cost(body: PredictCostBody = Body(...)):
@@ -270,35 +399,30 @@ def predict_cost(body: PredictCostBody = Body(...)):
     for each of the 3 curing methods, along with the recommended
     configuration that meets that deadline.
     """
-    sim = _get_simulator()
-    raw = sim.predict_cost(days=body.days, scenario=body.to_scenario(), verbose=False)
-    return PredictCostResponse(
-        input_days = body.days,
-        results    = [CuringResultWithConfig(**r) for r in raw],
-        scenario   = body.model_dump(),
-    )
+    return _predict_cost_response(body)
 
 
 @router.post(
     "/sensitivity/{signal}",
-    response_model=SensitivityResponse,
+    responses={200: {"model": SensitivityResponse, "content": {NDJSON: {}}}},
     summary="Sweep one signal — returns all 3 curing methods at each point",
 )
-def sensitivity(signal: str, body: SensitivityBody = Body(...)):
+async def sensitivity(signal: str, request: Request, body: SensitivityBody = Body(...)):
     """
     Vary a **single signal** across its full valid range.
     At each point, days and cost are returned for all 3 curing methods —
     ideal for rendering overlaid trade-off curves on the frontend.
+    `points` is columnar: `points.value[i]` pairs with `points.water_days[i]`, etc.
+    Validation runs on the event loop; the sweep itself runs on a worker thread.
+    Send `Accept: application/x-ndjson` to stream one row object per point instead
+    (`{"value": …, "water_days": …, …}` per line).
     """
-    if signal not in SIGNAL_RANGES:
+    if signal not in _SIGNAL_NAMES:
         raise HTTPException(
             status_code=422,
-            detail=f"Unknown signal '{signal}'. Valid: {list(SIGNAL_RANGES)}",
+            detail=f"Unknown signal '{signal}'. Valid: {_VALID_SIGNALS_TEXT}",
         )
-    sim = _get_simulator()
-    raw = sim.sensitivity(signal=signal, n_points=body.n_points, scenario=body.to_scenario())
-    return SensitivityResponse(
-        signal   = signal,
-        points   = [SensitivityPoint(value=r[signal], **{k: v for k, v in r.items() if k != signal}) for r in raw],
-        scenario = body.model_dump(),
-    )
+    if NDJSON in request.headers.get("accept", ""):
+        cols = await run_in_threadpool(_sensitivity_grid, body, signal)
+        return StreamingResponse(_ndjson_points(cols), media_type=NDJSON)
+    return await run_in_threadpool(_sensitivity_response, body, signal)
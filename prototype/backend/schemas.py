@@ -1,7 +1,18 @@
-from pydantic import BaseModel
-from typing import Optional, List
+from pydantic import BaseModel, ConfigDict, Field, create_model
+from typing import Optional, List, Tuple, Union
 from datetime import datetime
 
+from models import ProjectStatus, ElementType, CuringStatus
+
+
+def _all_optional(name: str, base: type[BaseModel]) -> type[BaseModel]:
+    """Partial-update schema: every field of base, Optional and defaulting to None."""
+    return create_model(
+        name,
+        __module__=__name__,
+        **{k: (Optional[f.annotation], None) for k, f in base.model_fields.items()},
+    )
+
 
 # ─── Equipment ────────────────────────────────────────────────────────────────
 
@@ -17,20 +28,14 @@ class EquipmentCreate(EquipmentBase):
     pass
 
 
-class EquipmentUpdate(BaseModel):
-    name: Optional[str] = None
-    type: Optional[str] = None
-    description: Optional[str] = None
-    status: Optional[str] = None
-    quantity: Optional[int] = None
+EquipmentUpdate = _all_optional("EquipmentUpdate", EquipmentBase)
 
 
 class EquipmentOut(EquipmentBase):
     id: int
     created_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ─── Element Equipment (junction) ─────────────────────────────────────────────
@@ -49,15 +54,14 @@ class ElementEquipmentOut(ElementEquipmentBase):
     id: int
     equipment: Optional[EquipmentOut] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ─── Element ──────────────────────────────────────────────────────────────────
 
 class ElementBase(BaseModel):
     name: str
-    type: Optional[str] = "slab"
+    type: Optional[ElementType] = ElementType.SLAB
     description: Optional[str] = None
     volume: Optional[float] = None
     length: Optional[float] = None
@@ -65,7 +69,7 @@ class ElementBase(BaseModel):
     height: Optional[float] = None
     grade: Optional[str] = None
     water_cement_ratio: Optional[float] = None
-    curing_status: Optional[str] = "pending"
+    curing_status: Optional[CuringStatus] = CuringStatus.PENDING
     curing_method: Optional[str] = None
     estimated_curing_days: Optional[int] = None
     actual_curing_days: Optional[int] = None
@@ -78,23 +82,7 @@ class ElementCreate(ElementBase):
     pass
 
 
-class ElementUpdate(BaseModel):
-    name: Optional[str] = None
-    type: Optional[str] = None
-    description: Optional[str] = None
-    volume: Optional[float] = None
-    length: Optional[float] = None
-    width: Optional[float] = None
-    height: Optional[float] = None
-    grade: Optional[str] = None
-    water_cement_ratio: Optional[float] = None
-    curing_status: Optional[str] = None
-    curing_method: Optional[str] = None
-    estimated_curing_days: Optional[int] = None
-    actual_curing_days: Optional[int] = None
-    curing_notes: Optional[str] = None
-    estimated_cost: Optional[float] = None
-    actual_cost: Optional[float] = None
+ElementUpdate = _all_optional("ElementUpdate", ElementBase)
 
 
 class ElementOut(ElementBase):
@@ -102,10 +90,20 @@ class ElementOut(ElementBase):
     project_id: int
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
-    element_equipment: List[ElementEquipmentOut] = []
+    element_equipment: List[ElementEquipmentOut] = Field(default_factory=list)
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ElementOutSlim(ElementBase):
+    """ElementOut with equipment links as ids; fetch details via ?expand=equipment."""
+    id: int
+    project_id: int
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    element_equipment_ids: List[int] = Field(default_factory=list)
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ─── Project ──────────────────────────────────────────────────────────────────
@@ -114,7 +112,7 @@ class ProjectBase(BaseModel):
     name: str
     location: Optional[str] = None
     description: Optional[str] = None
-    status: Optional[str] = "planning"
+    status: Optional[ProjectStatus] = ProjectStatus.PLANNING
     start_date: Optional[str] = None
     end_date: Optional[str] = None
     supervisor: Optional[str] = None
@@ -124,24 +122,20 @@ class ProjectCreate(ProjectBase):
     pass
 
 
-class ProjectUpdate(BaseModel):
-    name: Optional[str] = None
-    location: Optional[str] = None
-    description: Optional[str] = None
-    status: Optional[str] = None
-    start_date: Optional[str] = None
-    end_date: Optional[str] = None
-    supervisor: Optional[str] = None
+ProjectUpdate = _all_optional("ProjectUpdate", ProjectBase)
 
 
 class ProjectOut(ProjectBase):
     id: int
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
-    elements: List[ElementOut] = []
+    elements: List[ElementOutSlim] = Field(default_factory=list)
+
+    model_config = ConfigDict(from_attributes=True)
+
 
-    class Config:
-        from_attributes = True
+class ProjectOutExpanded(ProjectOut):
+    elements: List[ElementOut] = Field(default_factory=list)
 
 
 class ProjectSummary(ProjectBase):
@@ -149,8 +143,7 @@ class ProjectSummary(ProjectBase):
     created_at: Optional[datetime] = None
     element_count: int = 0
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ─── Curing Suggestion ────────────────────────────────────────────────────────
@@ -161,4 +154,4 @@ class CuringSuggestion(BaseModel):
     estimated_cost: float
     notes: str
     temperature_requirement: Optional[str] = None
-    equipment_recommended: List[str] = []
+    equipment_recommended: Union[Tuple[str, ...], List[str]] = Field(default_factory=list)